@@ -1,16 +1,18 @@
 import os.path
-import pickle
-from typing import Optional
+from collections import namedtuple
+from typing import Optional, List, Tuple
 
 import numpy as np
 import pandas as pd
 
 from backtesting.agent.TradingAgent import TradingAgent
-from backtesting.order.base import LimitOrder
+from backtesting.order.types import Bid, Ask
 from backtesting.typing import FileName
-from backtesting.utils.structures import PriorityQueue
 from backtesting.utils.util import log_print
 
+# Single order of the historical stream. Fields follow the columns of the processed orders file
+HistoricalOrder = namedtuple('HistoricalOrder', ('Order_ID', 'Price', 'Direction', 'Size', 'Type'))
+
 
 class MarketReplayAgentUSD(TradingAgent):
     __slots__ = (
@@ -18,7 +20,8 @@ class MarketReplayAgentUSD(TradingAgent):
         "date",
         "executed_trades",
         "historical_orders",
-        "wakeup_times"
+        "schedule",
+        "schedule_idx"
     )
 
     def __init__(self,
@@ -53,15 +56,24 @@ class MarketReplayAgentUSD(TradingAgent):
             orders_file_path,
             processed_orders_folder_path
         )
-        self.wakeup_times: PriorityQueue = self.historical_orders.wakeup_times
+        self.schedule: List[Tuple[pd.Timestamp, np.recarray]] = self.historical_orders.schedule
+        self.schedule_idx = 0
 
     def wakeup(self, current_time: pd.Timestamp) -> None:
         super().wakeup(current_time)
-        wakeup_times = self.wakeup_times
-        if wakeup_times:
-            wakeup_time = wakeup_times.get()
-            self.setWakeup(wakeup_time)
-            self.placeOrder(current_time, self.historical_orders.orders_dict[current_time])
+        schedule = self.schedule
+        schedule_len = len(schedule)
+        idx = start_idx = self.schedule_idx
+        # Submit every batch which is due by now
+        while idx < schedule_len and schedule[idx][0] <= current_time:
+            self.placeOrder(current_time, map(HistoricalOrder._make, schedule[idx][1].tolist()))
+            idx += 1
+        if idx == start_idx:
+            # Nothing was due: the wakeup for the next batch has already been requested
+            return
+        self.schedule_idx = idx
+        if idx < schedule_len:
+            self.setWakeup(schedule[idx][0])
         else:
             log_print(f"Market Replay Agent submitted all orders. Last order @ {current_time}")
 
@@ -72,28 +84,75 @@ class MarketReplayAgentUSD(TradingAgent):
             self.executed_trades[current_time] = [order.fill_price, order.quantity]
             self.last_trade[self.symbol] = order.fill_price
 
-    def placeOrder(self, currentTime, order):
-        if len(order) == 1:
-            order = order[0]
-            order_id = order['Order_ID']
-            existing_order = self.orders.get(order_id)
-            if not existing_order and order['Size'] > 0 and order['Type'] == 'R':
-                self.placeLimitOrder(self.symbol, order['Size'], order['Direction'] == 'BUY', order['Price'],
-                                     order_id=order_id)
-            elif existing_order and order['Size'] == 0:
+    def placeOrder(self, currentTime, orders):
+        """
+        Submit, cancel or modify the agent's orders according to a batch of historical orders.
+
+        Examples:
+            >>> import os.path
+            >>> import tempfile
+            >>>
+            >>> class RecordingAgent(MarketReplayAgentUSD):
+            ...     def sendMessage(self, recipient_id, msg, delay=0):
+            ...         new_order = getattr(msg, 'new_order', msg.order)
+            ...         print(msg.type, msg.order.order_id, new_order.is_buy_order, new_order.quantity,
+            ...               new_order.limit_price)
+            >>>
+            >>> orders_df = pd.DataFrame({
+            ...     'Timestamp': pd.to_datetime(['2021-03-22 10:30'] * 5) + pd.to_timedelta([0, 0, 1, 1, 1], unit='ns'),
+            ...     'Order_ID': [101, 102, 101, 102, 103],
+            ...     'Price': [100, 101, 100, 99, 102],
+            ...     'Direction': np.array([1, 0, 1, 0, 1], dtype=np.int8),
+            ...     'Size': [5, 6, 0, 4, 7],
+            ...     'Type': np.array([0, 0, 0, 0, 1], dtype=np.int8)
+            ... })
+            >>> date = pd.Timestamp('2021-03-22')
+            >>> with tempfile.TemporaryDirectory() as tmp_dir:
+            ...     L3OrdersProcessor.writeProcessedOrders(
+            ...         orders_df, os.path.join(tmp_dir, 'marketreplay_ABC_2021-03-22.parquet')
+            ...     )
+            ...     agent = RecordingAgent(
+            ...         agent_id=0, name='MARKET_REPLAY_AGENT', random_state=np.random.RandomState(0), symbol='ABC',
+            ...         starting_cash=0, date=date, start_time=date, end_time=date + pd.Timedelta('1D'),
+            ...         orders_file_path='', processed_orders_folder_path=os.path.join(tmp_dir, '')
+            ...     )  # doctest: +ELLIPSIS
+            Processed file exists for ABC and 2021-03-22: ...
+            Number of Orders: 5
+            >>> for time, batch in agent.schedule:
+            ...     agent.current_time = time
+            ...     agent.placeOrder(time, map(HistoricalOrder._make, batch.tolist()))
+            LIMIT_ORDER 101 True 5 100
+            LIMIT_ORDER 102 False 6 101
+            CANCEL_ORDER 101 True 5 100
+            MODIFY_ORDER 102 False 4 99
+
+        Args:
+            currentTime:  current simulation time
+            orders:       historical orders of a batch of the schedule
+
+        Returns:
+            None
+        """
+        symbol = self.symbol
+        agent_orders = self.orders
+        for order in orders:
+            order_id = order.Order_ID
+            size = order.Size
+            existing_order = agent_orders.get(order_id)
+            if not existing_order and size > 0 and order.Type == L3OrdersProcessor.R:
+                self.placeLimitOrder(symbol, size, order.Direction == L3OrdersProcessor.BUY,
+                                     limit_price=order.Price, order_id=order_id)
+            elif existing_order and size == 0:
                 self.cancelOrder(existing_order)
-            elif existing_order and order['Size'] > 0:
+            elif existing_order and size > 0:
                 # self.modifyLimitOrder(existing_order, LimitOrder(self.id, currentTime, self.symbol, order['SIZE'],
                 #                                             order['BUY_SELL_FLAG'] == 'BUY', order['PRICE'],
                 #                                             order_id=order_id))
-                self.modifyOrder(existing_order, LimitOrder(self.id, currentTime, self.symbol, order['Size'],
-                                                            order['Direction'] == 'BUY', order['Price'],
-                                                            order_id=order_id))
+                self.modifyOrder(existing_order, (Bid if order.Direction == L3OrdersProcessor.BUY else Ask)(
+                    self.id, currentTime, symbol, quantity=size, limit_price=order.Price, order_id=order_id
+                ))
             else:
                 None  # TODO: check if something is comming here. We should process A and Z types as well
-        else:
-            for ind_order in order:
-                self.placeOrder(currentTime, order=[ind_order])
 
     def getWakeFrequency(self):
         log_print(f"Market Replay Agent first wake up: {self.historical_orders.first_wakeup}")
@@ -105,11 +164,25 @@ class MarketReplayAgentUSD(TradingAgent):
 
 class L3OrdersProcessor:
     # COLUMNS = ['TIMESTAMP', 'ORDER_ID', 'PRICE', 'SIZE', 'BUY_SELL_FLAG']
-    DIRECTION = {0: 'BUY', 1: 'SELL'}  # 0 - bid, 1-ask
+    # Direction codes of processed orders. Note that BUY_SELL_FLAG of the source stream is 0 - bid, 1 - ask
+    BUY = 1
+    SELL = 0
+
+    # Record type codes of processed orders. Unknown record types are coded as -1
+    R = 0
+    A = 1
+    Z = 2
+    RECORD_TYPES = {'R': R, 'A': A, 'Z': Z}
 
     # COLUMNS = ['Time', 'Type', 'Order_ID', 'Size', 'Price', 'Direction']
     # DIRECTION = {1: 'BUY', -1: 'SELL'}
 
+    # Base of seconds-since-midnight timestamps of the raw stream, in nanoseconds since epoch
+    DATE_BASE_NS = int(np.datetime64('2012-06-21', 'ns').astype(np.int64))
+
+    # Columns of the processed orders file (columnar Parquet store)
+    PROCESSED_COLUMNS = ['Timestamp', *HistoricalOrder._fields]
+
     # Class for reading historical exchange orders stream
     def __init__(self, symbol, date, start_time, end_time, orders_file_path, processed_orders_folder_path):
         self.symbol = symbol
@@ -119,29 +192,30 @@ class L3OrdersProcessor:
         self.orders_file_path = orders_file_path
         self.processed_orders_folder_path = processed_orders_folder_path
 
-        self.orders_dict = self.processOrders()
-        self.wakeup_times = PriorityQueue(self.orders_dict)
-        self.first_wakeup = self.wakeup_times[0]
+        # Time-sorted batches of orders, walked by the agent with an index rather than looked up by timestamp
+        self.schedule = self.processOrders()
+        if not self.schedule:
+            raise ValueError(
+                f"No historical orders for {symbol} on {date.date()} between {start_time} and {end_time}"
+            )
+        self.first_wakeup = self.schedule[0][0]
 
     def processOrders(self):
         def convertDate(date_str):
             try:
                 # return datetime.strptime(date_str, '%Y%m%d%H%M%S.%f')
 
-                return pd.to_datetime("2012-06-21 00:00:00") + pd.Timedelta(seconds=float(date_str))
+                return np.datetime64(self.DATE_BASE_NS + int(round(float(date_str) * 1e9)), 'ns')
                 # return pd.Timestamp("2012-06-21 00:00:00") + float(date_str) * pd.offsets.Second()
             except ValueError:
                 return None  # convertDate(date_str[:-1])
 
-        # @mem.cache
-        def read_processed_orders_file(processed_orders_file):
-            with open(processed_orders_file, 'rb') as handle:
-                return pickle.load(handle)
-
-        processed_orders_file = f'{self.processed_orders_folder_path}marketreplay_{self.symbol}_{self.date.date()}.pkl'
+        processed_orders_file = (
+            f'{self.processed_orders_folder_path}marketreplay_{self.symbol}_{self.date.date()}.parquet'
+        )
         if os.path.isfile(processed_orders_file):
             print(f'Processed file exists for {self.symbol} and {self.date.date()}: {processed_orders_file}')
-            return read_processed_orders_file(processed_orders_file)
+            orders_df = self.readProcessedOrders(processed_orders_file)
         else:
             print(f'Processed file does not exist for {self.symbol} and {self.date.date()}, processing...')
 
@@ -150,10 +224,10 @@ class L3OrdersProcessor:
             orders_df = orders_df[
                 (orders_df.Time > '2021-03-22 10:30') & (orders_df.Time < '2021-03-22 11:00')]  # DEBUG
             orders_df['correction'] = orders_df.groupby('Time').cumcount()
-            orders_df['Time'] = orders_df['Time'] + orders_df.correction.apply(lambda x: pd.Timedelta(x, unit='ns'))
+            orders_df['Time'] = orders_df['Time'] + pd.to_timedelta(orders_df['correction'].to_numpy(), unit='ns')
             # orders_df.columns = self.COLUMNS
-            orders_df['Direction'] = orders_df['BUY_SELL_FLAG'].astype(int).replace(
-                L3OrdersProcessor.DIRECTION)  # TODO:verify
+            # TODO:verify
+            orders_df['Direction'] = (orders_df['BUY_SELL_FLAG'].to_numpy().astype(np.int8) == 0).astype(np.int8)
             # orders_df['Timestamp'] = orders_df['Time'].astype(str).apply(convertDate)
             # orders_df['Size'] = orders_df['Size'].astype(int)
             # orders_df['Price'] = orders_df['Price'].astype(int)
@@ -165,12 +239,63 @@ class L3OrdersProcessor:
                 'RECORD_TYPE': 'Type',
                 'ORDER_ID': 'Order_ID'
             }, inplace=True)
-            orders_df = orders_df[['Timestamp', 'Order_ID', 'Price', 'Direction', 'Size', 'Type']]
+            orders_df['Type'] = orders_df['Type'].map(self.RECORD_TYPES).fillna(-1).astype(np.int8)
+            orders_df = orders_df[self.PROCESSED_COLUMNS]
             orders_df = orders_df.loc[(orders_df.Timestamp >= self.start_time) & (orders_df.Timestamp < self.end_time)]
-            orders_df.set_index('Timestamp', inplace=True)
-            log_print(f"Number of Orders: {len(orders_df)}")
-            orders_dict = {k: g.to_dict(orient='records') for k, g in orders_df.groupby(level=0)}
-            with open(processed_orders_file, 'wb') as handle:
-                pickle.dump(orders_dict, handle, protocol=pickle.HIGHEST_PROTOCOL)
-                print(f'processed file created as {processed_orders_file}')
-            return orders_dict
+            self.writeProcessedOrders(orders_df, processed_orders_file)
+            print(f'processed file created as {processed_orders_file}')
+
+        log_print(f"Number of Orders: {len(orders_df)}")
+
+        return self.buildSchedule(orders_df)
+
+    @staticmethod
+    def writeProcessedOrders(orders_df: pd.DataFrame, processed_orders_file: FileName) -> None:
+        # Parquet format 2.0 keeps nanosecond timestamps: format 1.0 would truncate them to microseconds
+        # and merge the orders which were made distinct by the nanosecond correction
+        orders_df.to_parquet(processed_orders_file, engine='pyarrow', compression='zstd', index=False, version='2.0')
+
+    @classmethod
+    def readProcessedOrders(cls, processed_orders_file: FileName) -> pd.DataFrame:
+        return pd.read_parquet(processed_orders_file, engine='pyarrow', columns=cls.PROCESSED_COLUMNS)
+
+    @staticmethod
+    def buildSchedule(orders_df: pd.DataFrame) -> List[Tuple[pd.Timestamp, np.recarray]]:
+        """
+        Split the table of processed orders into time-sorted batches of orders sharing the same timestamp.
+
+        Examples:
+            >>> import os.path
+            >>> import tempfile
+            >>>
+            >>> orders_df = pd.DataFrame({
+            ...     'Timestamp': pd.to_datetime(['2021-03-22 10:30'] * 3) + pd.to_timedelta([0, 1, 1], unit='ns'),
+            ...     'Order_ID': [1, 2, 3],
+            ...     'Price': [100, 101, 102],
+            ...     'Direction': np.array([1, 0, 1], dtype=np.int8),
+            ...     'Size': [5, 6, 7],
+            ...     'Type': np.array([0, 0, 0], dtype=np.int8)
+            ... })
+            >>> with tempfile.TemporaryDirectory() as tmp_dir:
+            ...     processed_orders_file = os.path.join(tmp_dir, 'orders.parquet')
+            ...     L3OrdersProcessor.writeProcessedOrders(orders_df, processed_orders_file)
+            ...     orders_df = L3OrdersProcessor.readProcessedOrders(processed_orders_file)
+            >>> [(str(time), batch.Order_ID.tolist()) for time, batch in L3OrdersProcessor.buildSchedule(orders_df)]
+            [('2021-03-22 10:30:00', [1]), ('2021-03-22 10:30:00.000000001', [2, 3])]
+
+        Args:
+            orders_df:  processed orders with the PROCESSED_COLUMNS columns
+
+        Returns:
+            list of (timestamp, record array of orders) pairs sorted by timestamp
+        """
+        if orders_df.empty:
+            return []
+
+        # Split the time-sorted table into contiguous per-timestamp record arrays without building per-row dicts.
+        # Timestamps are sorted, so buckets start wherever the timestamp changes and the splits are views
+        orders_df = orders_df.sort_values('Timestamp', kind='mergesort')
+        timestamps = orders_df['Timestamp'].to_numpy()
+        starts = np.flatnonzero(timestamps[1:] != timestamps[:-1]) + 1
+        buckets = np.split(orders_df.drop(columns='Timestamp').to_records(index=False), starts)
+        return list(zip(pd.DatetimeIndex(timestamps[np.r_[0, starts]]), buckets))
@@ -461,8 +461,8 @@ class ExchangeAgent(FinancialAgent, Generic[OracleType]):
         if order.symbol not in self.order_books:
             log_print(f"Cancellation request discarded. Unknown symbol: {symbol}")
         else:
-            # Hand the order to the order book for processing.
-            self.order_books[symbol].cancelLimitOrder(deepcopy(order))
+            # Hand the order to the order book for processing. It is only read there, so no copy is needed.
+            self.order_books[symbol].cancelLimitOrder(order)
             self.publishOrderBookData()
 
     def processModifyOrderRequest(self, msg: ModifyOrderRequest) -> None:
@@ -479,7 +479,8 @@ class ExchangeAgent(FinancialAgent, Generic[OracleType]):
         if order.symbol not in self.order_books:
             log_print(f"Modification request discarded. Unknown symbol: {symbol}")
         else:
-            self.order_books[symbol].modifyLimitOrder(deepcopy(order), deepcopy(new_order))
+            # The old order is only read to locate the resting one, while the new one is stored in the book.
+            self.order_books[symbol].modifyLimitOrder(order, deepcopy(new_order))
             self.publishOrderBookData()
 
     def processQueryLastTrade(self, msg: QueryLastTrade, mkt_closed: bool) -> None:
@@ -846,9 +847,10 @@ class OrderBook:
                 # There are orders on this side. Insert this order in the correct position in the list.
                 # Note that o is a DEQUE of all orders (oldest at index 0) at this same price.
                 populate_new_level = False
+                limit_price = order.limit_price
                 for i, same_price_orders in enumerate(book):
                     first_order = same_price_orders[0]
-                    if order.hasEqPrice(first_order):
+                    if limit_price == first_order.limit_price:
                         same_price_orders.append(order)
                         break
                     if order.hasBetterPrice(first_order):
@@ -880,8 +882,9 @@ class OrderBook:
         # then find the exact order and cancel it.
         # Note that o is a LIST of all orders (oldest at index 0) at this same price.
         order_id = order.order_id
+        limit_price = order.limit_price
         for i, same_price_orders in enumerate(book):
-            if order.hasEqPrice(same_price_orders[0]):
+            if limit_price == same_price_orders[0].limit_price:
                 # This is the correct price level.
                 break
         else:
@@ -936,8 +939,9 @@ class OrderBook:
         if not book:
             print(f"WARNING: modifyLimitOrder() called with order {order.order_id}, but OrderBook is empty")
             return
+        limit_price = order.limit_price
         for i, same_price_orders in enumerate(book):
-            if order.hasEqPrice(same_price_orders[0]):
+            if limit_price == same_price_orders[0].limit_price:
                 break
         else:
             print(
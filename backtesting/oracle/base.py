@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -19,3 +19,27 @@ class Oracle(metaclass=ABCMeta):
                      sigma_n: int = 1_000,
                      random_state: Optional[np.random.RandomState] = None) -> int:
         pass
+
+    def observePrices(self,
+                      symbol: str,
+                      times: Union[Sequence[pd.Timestamp], np.ndarray],
+                      sigma_n: int = 1_000,
+                      random_state: Optional[np.random.RandomState] = None) -> np.ndarray:
+        """
+        Make a batch of noisy price observations. Oracles able to vectorize the lookup should override this method.
+
+        Args:
+            symbol:        symbol of interest
+            times:         observation times
+            sigma_n:       observation noise variance
+            random_state:  random state of the observing agent
+
+        Returns:
+            int64 array of observed prices, one per observation time
+        """
+        times = pd.DatetimeIndex(times)
+        return np.fromiter(
+            (self.observePrice(symbol, t, sigma_n, random_state) for t in times),
+            dtype=np.int64,
+            count=len(times)
+        )
@@ -11,13 +11,14 @@ experiment we are running with more active agent types.
 
 import datetime as dt
 import os
-from bisect import bisect_left
+import warnings
 from math import sqrt, exp
-from typing import List
+from typing import List, Dict, Tuple, Sequence, Union, Optional
 
 import numpy as np
 import pandas as pd
 from joblib import Memory
+from numba import njit, prange
 
 from backtesting.oracle.base import Oracle
 from backtesting.typing import FileName
@@ -51,6 +52,53 @@ def read_trades(trade_file: FileName, symbols: List[str]) -> pd.DataFrame:
     return df
 
 
+def _to_ns(times: pd.DatetimeIndex) -> np.ndarray:
+    # Nanoseconds since epoch, independently of the resolution of the index (pandas 2 allows s/ms/us ones)
+    return np.ascontiguousarray(times.values.astype('datetime64[ns]').view(np.int64))
+
+
+def fundamental_memmap_paths(fundamental_file_path: FileName) -> Tuple[str, str]:
+    """
+    Paths of the raw binary timestamps (little-endian int64 nanoseconds) and values (little-endian float64) files
+    which store the fundamental series of the given pickle file in memory-mappable form.
+    """
+    root = os.path.splitext(fundamental_file_path)[0]
+    return f'{root}.ts.bin', f'{root}.v.bin'
+
+
+def convert_fundamental_to_memmap(fundamental_file_path: FileName) -> Tuple[str, str]:
+    """
+    Write the pickled fundamental series into the files given by ``fundamental_memmap_paths`` and return their paths.
+    ExternalFileOracle memory-maps these files instead of unpickling the series when they are present.
+    """
+    fundamental_series = pd.read_pickle(fundamental_file_path)
+    times_path, values_path = fundamental_memmap_paths(fundamental_file_path)
+    _to_ns(fundamental_series.index).astype('<i8', copy=False).tofile(times_path)
+    np.ascontiguousarray(fundamental_series.values, dtype='<f8').tofile(values_path)
+    return times_path, values_path
+
+
+@njit(cache=True, fastmath=True)
+def _interpolate(query_ns, time_low, time_high, price_low, price_high):
+    # Linear interpolation between (time_low, price_low) and (time_high, price_high), times in nanoseconds
+    if time_high == time_low:
+        return price_low
+    return price_low + (query_ns - time_low) * (price_high - price_low) / (time_high - time_low)
+
+
+@njit(cache=True, parallel=True)
+def _interpolate_many(query_ns, times_ns, values):
+    # Vectorized counterpart of ExternalFileOracle.getPriceAtTime: queries outside the series are clamped to it
+    last_idx = len(times_ns) - 1
+    prices = np.empty(len(query_ns), dtype=np.float64)
+    for i in prange(len(query_ns)):
+        q = min(max(query_ns[i], times_ns[0]), times_ns[last_idx])
+        lower_idx = max(np.searchsorted(times_ns, q) - 1, 0)
+        upper_idx = min(lower_idx + 1, last_idx)
+        prices[i] = _interpolate(q, times_ns[lower_idx], times_ns[upper_idx], values[lower_idx], values[upper_idx])
+    return prices
+
+
 class DataOracle(Oracle):
     def __init__(self, historical_date=None, symbols: List[str] = None, data_dir=None):
         self.historical_date = historical_date
@@ -162,18 +210,53 @@ class ExternalFileOracle(Oracle):
         self.fundamentals = self.load_fundamentals()
         self.f_log = {symbol: [] for symbol in symbols}
 
-    def load_fundamentals(self):
+    def load_fundamentals(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
         """
-        Method extracts fundamentals for each symbol into DataFrames. Note that input files must be of the form
-        generated by util/formatting/mid_price_from_orderbook.py.
+        Method extracts fundamentals for each symbol into pairs of NumPy arrays: int64 nanosecond timestamps and
+        float64 values. Note that input files must be of the form generated by
+        util/formatting/mid_price_from_orderbook.py.
+        If binary files produced by convert_fundamental_to_memmap exist next to the input file and are not older
+        than it, they are memory-mapped read-only instead, so the series are paged in on demand rather than unpickled.
+        Stale binary files and binary files of mismatching or zero lengths are ignored with a warning.
         """
-        fundamentals = {}
+        fundamentals: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
         log_print("Oracle: loading fundamental price series...")
         for symbol, params_dict in self.symbols.items():
             fundamental_file_path = params_dict['fundamental_file_path']
-            log_print("Oracle: loading {}", fundamental_file_path)
-            fundamental_df = pd.read_pickle(fundamental_file_path)
-            fundamentals.update({symbol: fundamental_df})
+            times_path, values_path = fundamental_memmap_paths(fundamental_file_path)
+            use_memmap = os.path.isfile(times_path) and os.path.isfile(values_path)
+            if use_memmap:
+                # Both files hold 8-byte items. The interpolation kernels do not check bounds,
+                # so the timestamps and the values must be of the same non-zero length
+                times_size = os.path.getsize(times_path)
+                values_size = os.path.getsize(values_path)
+                if os.path.getmtime(fundamental_file_path) > min(os.path.getmtime(times_path),
+                                                                 os.path.getmtime(values_path)):
+                    problem = f"{fundamental_file_path} is newer than them"
+                elif not times_size or times_size != values_size or times_size % 8:
+                    problem = f"their sizes ({times_size} and {values_size} bytes) do not match a non-empty series"
+                else:
+                    problem = ''
+                if problem:
+                    warnings.warn(
+                        f"Oracle: ignoring {times_path} and {values_path}: {problem}. "
+                        f"Loading {fundamental_file_path} instead. Re-run convert_fundamental_to_memmap to refresh them",
+                        UserWarning, stacklevel=1
+                    )
+                    use_memmap = False
+            if use_memmap:
+                log_print("Oracle: memory-mapping {} and {}", times_path, values_path)
+                fundamentals[symbol] = (
+                    np.memmap(times_path, dtype='<i8', mode='r'),
+                    np.memmap(values_path, dtype='<f8', mode='r')
+                )
+            else:
+                log_print("Oracle: loading {}", fundamental_file_path)
+                fundamental_series = pd.read_pickle(fundamental_file_path)
+                fundamentals[symbol] = (
+                    _to_ns(fundamental_series.index),
+                    np.ascontiguousarray(fundamental_series.values, dtype=np.float64)
+                )
 
         log_print("Oracle: loading fundamental price series complete!")
         return fundamentals
@@ -201,31 +284,28 @@ class ExternalFileOracle(Oracle):
 
         log_print("Oracle: client requested {} as of {}", symbol, query_time)
 
-        fundamental_series = self.fundamentals[symbol]
-        time_of_query = pd.Timestamp(query_time)
-
-        series_open_time = fundamental_series.index[0]
-        series_close_time = fundamental_series.index[-1]
+        times_ns, values = self.fundamentals[symbol]
+        query_ns = pd.Timestamp(query_time).value
 
-        if time_of_query < series_open_time:  # time queried before open
-            return fundamental_series[0]
-        elif time_of_query > series_close_time:  # time queried after close
-            return fundamental_series[-1]
+        if query_ns < times_ns[0]:  # time queried before open
+            return values[0]
+        elif query_ns > times_ns[-1]:  # time queried after close
+            return values[-1]
         else:  # time queried during trading
 
             # find indices either side of requested time
-            lower_idx = bisect_left(fundamental_series.index, time_of_query) - 1
-            upper_idx = lower_idx + 1 if lower_idx < len(fundamental_series.index) - 1 else lower_idx
+            lower_idx = max(int(np.searchsorted(times_ns, query_ns)) - 1, 0)
+            upper_idx = lower_idx + 1 if lower_idx < len(times_ns) - 1 else lower_idx
 
             # interpolate between values
-            lower_val = fundamental_series[lower_idx]
-            upper_val = fundamental_series[upper_idx]
+            lower_val = values[lower_idx]
+            upper_val = values[upper_idx]
 
             log_print(
                 f"DEBUG: lower_idx: {lower_idx}, lower_val: {lower_val}, upper_idx: {upper_idx}, upper_val: {upper_val}")
 
-            interpolated_price = self.getInterpolatedPrice(query_time, fundamental_series.index[lower_idx],
-                                                           fundamental_series.index[upper_idx], lower_val, upper_val)
+            interpolated_price = self.getInterpolatedPrice(query_ns, times_ns[lower_idx], times_ns[upper_idx],
+                                                           lower_val, upper_val)
             log_print("Oracle: latest historical trade was {} at {}. Next historical trade is {}. "
                       "Interpolated price is {}", lower_val, query_time, upper_val, interpolated_price)
 
@@ -253,30 +333,82 @@ class ExternalFileOracle(Oracle):
 
         return int(round(observed))
 
+    def observePrices(self,
+                      symbol: str,
+                      times: Union[Sequence[pd.Timestamp], np.ndarray],
+                      sigma_n: float = 0.0001,
+                      random_state: Optional[np.random.RandomState] = None) -> np.ndarray:
+        """ Make a batch of observations of price, using one compiled lookup and one noise draw for all of them.
+        :param symbol: symbol for which to observe price
+        :type symbol: str
+        :param times: times of observation
+        :type times: Sequence[pd.Timestamp] or np.ndarray of datetime64[ns]
+        :param sigma_n: Observation noise parameter
+        :type sigma_n: float
+        :param random_state: random state for Agent making observation
+        :type random_state: np.RandomState
+        :return: np.ndarray of int64, prices in cents
+
+        A batch gives the same observations and fundamental log as the equivalent sequence of observePrice calls:
+
+        >>> import os.path
+        >>> import tempfile
+        >>>
+        >>> series = pd.Series([100.0, 110.0, 90.0], index=pd.to_datetime(['2021-03-22 10:00', '10:01', '10:02']))
+        >>> times = pd.to_datetime(['2021-03-22 09:59', '10:00:30', '10:01:45', '10:03'])
+        >>> with tempfile.TemporaryDirectory() as tmp_dir:
+        ...     fundamental_file_path = os.path.join(tmp_dir, 'ABC.pkl')
+        ...     series.to_pickle(fundamental_file_path)
+        ...     batch_oracle = ExternalFileOracle({'ABC': {'fundamental_file_path': fundamental_file_path}})
+        ...     scalar_oracle = ExternalFileOracle({'ABC': {'fundamental_file_path': fundamental_file_path}})
+        >>> batch = batch_oracle.observePrices('ABC', times, sigma_n=4, random_state=np.random.RandomState(7))
+        >>> random_state = np.random.RandomState(7)
+        >>> looped = [scalar_oracle.observePrice('ABC', t, sigma_n=4, random_state=random_state) for t in times]
+        >>> batch.tolist() == looped
+        True
+        >>> batch_oracle.f_log == scalar_oracle.f_log
+        True
+        """
+        times_index: pd.DatetimeIndex = pd.DatetimeIndex(times)
+        times_ns, values = self.fundamentals[symbol]
+        query_ns = _to_ns(times_index)
+
+        true_prices = _interpolate_many(query_ns, times_ns, values)
+
+        # Like getPriceAtTime, only queries within the fundamental series are logged
+        in_range = np.flatnonzero((query_ns >= times_ns[0]) & (query_ns <= times_ns[-1]))
+        self.f_log[symbol].extend(
+            {'FundamentalTime': t, 'FundamentalValue': v}
+            for t, v in zip(times_index[in_range], true_prices[in_range].tolist())
+        )
+
+        if sigma_n == 0:
+            observed = true_prices
+        elif random_state is None:
+            raise ValueError("observePrices() requires random_state for noisy observations (sigma_n != 0)")
+        else:
+            observed = true_prices + random_state.standard_normal(len(true_prices)) * sqrt(sigma_n)
+
+        return np.rint(observed).astype(np.int64)
+
     def getInterpolatedPrice(self, current_time, time_low, time_high, price_low, price_high):
         """ Get the price at current_time, linearly interpolated between price_low and price_high measured at times
             time_low and time_high
-            :param current_time: time for which price is to be interpolated
-            :type current_time: pd.Timestamp
-            :param time_low: time of first fundamental value
-            :type time_low: pd.Timestamp
-            :param time_high: time of first fundamental value
-            :type time_high: pd.Timestamp
+            :param current_time: time for which price is to be interpolated, in nanoseconds since epoch
+            :type current_time: int
+            :param time_low: time of first fundamental value, in nanoseconds since epoch
+            :type time_low: int
+            :param time_high: time of second fundamental value, in nanoseconds since epoch
+            :type time_high: int
             :param price_low: first fundamental value
             :type price_low: float
-            :param price_high: first fundamental value
+            :param price_high: second fundamental value
             :type price_high: float
             :return float of interpolated price:
         """
         log_print(
             f'DEBUG: current_time: {current_time} time_low {time_low} time_high: {time_high} price_low:  {price_low} price_high: {price_high}')
-        delta_y = price_high - price_low
-        delta_x = (time_high - time_low).total_seconds()
-
-        slope = delta_y / delta_x if price_low != price_high else 0
-        x_fwd = (current_time - time_low).total_seconds()
-
-        return price_low + (x_fwd * slope)
+        return _interpolate(current_time, time_low, time_high, price_low, price_high)
 
 
 class MeanRevertingOracle(Oracle):
@@ -1,7 +1,7 @@
 import sys
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
-from typing import MutableSet, Optional, Any, Dict
+from typing import MutableSet, Optional, Any, Dict, Type, TypeVar, ClassVar, Tuple
 
 import pandas as pd
 
@@ -18,6 +18,25 @@ __all__ = (
     "silent_mode"
 )
 
+# Types of the ``tag`` field which are immutable and atomic, so the field can be shared
+# between an order and its deep copy without recursing into ``copy.deepcopy``.
+_ATOMIC_TAG_TYPES = frozenset((type(None), int, float, bool, complex, str, bytes))
+
+_OrderType = TypeVar('_OrderType', bound='Order')
+
+
+def _repr_as_str(cls: Type[_OrderType]) -> Type[_OrderType]:
+    """
+    Class decorator that sets ``__repr__`` of an order class to the ``__str__`` defined in the class body.
+
+    Args:
+        cls:  order class
+    Returns:
+        the same class
+    """
+    cls.__repr__ = cls.__dict__['__str__']  # type: ignore
+    return cls
+
 
 class Order(metaclass=ABCMeta):
     """
@@ -36,6 +55,10 @@ class Order(metaclass=ABCMeta):
     )
     _counter = 0
     _order_ids: MutableSet[int] = set()
+    _slot_names: ClassVar[Tuple[str, ...]] = ()
+
+    # Verbosity switch, e.g. set by configs: the string representations of all orders are empty when True
+    silent_mode: ClassVar[bool] = silent_mode
 
     def __init__(self,
                  agent_id: int,
@@ -64,8 +87,11 @@ class Order(metaclass=ABCMeta):
         # Time at which the order was created by the agent.
         self.time_placed = time_placed
 
-        # Equity symbol for the order.
-        self.symbol = symbol
+        # Equity symbol for the order. Interned, so that the many orders of a symbol share a single
+        # string object and equality checks against it succeed on the identity fast path.
+        # sys.intern rejects str subclasses such as np.str_, so these are converted to str first.
+        # Symbols of other types are kept as is, so that they still match the keys of the order books
+        self.symbol = sys.intern(str(symbol)) if isinstance(symbol, str) else symbol
 
         # Number of equity units affected by the order.
         self.quantity = quantity
@@ -142,20 +168,71 @@ class Order(metaclass=ABCMeta):
 
     get_defined_slots = classmethod(get_defined_slots)
 
-    @abstractmethod
-    def __copy__(self) -> 'Order':
-        pass
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Names of all the slots in the MRO, used to clone orders without calling __init__
+        cls._slot_names = tuple(cls.get_defined_slots())
 
-    @abstractmethod
-    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> 'Order':
-        pass
+    def __copy__(self: _OrderType) -> _OrderType:
+        """
+        Clone the order slot by slot, keeping its order ID.
 
-    @abstractmethod
-    def __str__(self) -> str:
-        pass
+        Examples:
+            >>> from copy import copy
+            >>> from backtesting.order.types import Ask, Bid
+            >>>
+            >>> bid = Bid(2, pd.Timestamp('1989'), 'AAPL', quantity=3, limit_price=324, tag='momentum')
+            >>> bid_copy = copy(bid)
+            >>> type(bid_copy) is Bid and bid_copy.to_dict() == bid.to_dict()
+            True
+            >>> bid_copy.order_id == bid.order_id and bid_copy.tag is bid.tag
+            True
+
+        Returns:
+            shallow copy of the order
+        """
+        # Bypass __init__: the order ID of the original is already registered
+        cls = self.__class__
+        order = cls.__new__(cls)
+        for name in cls._slot_names:
+            setattr(order, name, getattr(self, name))
+        return order
+
+    def __deepcopy__(self: _OrderType, memo: Optional[Dict[int, Any]] = None) -> _OrderType:
+        """
+        Clone the order slot by slot, keeping its order ID. Atomic tags are shared, other tags are deep-copied.
+
+        Examples:
+            >>> from backtesting.order.types import Ask, Bid
+            >>>
+            >>> ask = Ask(5, pd.Timestamp('2013-11-02'), 'USD/RUB', quantity=20, limit_price=2, tag=['hedge'])
+            >>> ask_copy = deepcopy(ask)
+            >>> type(ask_copy) is Ask and ask_copy.to_dict() == ask.to_dict()
+            True
+            >>> ask_copy.order_id == ask.order_id
+            True
+            >>> ask_copy.tag == ask.tag and ask_copy.tag is not ask.tag
+            True
+            >>> bid = Bid(5, pd.Timestamp('2013-11-02'), 'USD/RUB', quantity=1, limit_price=3, tag=('$$', 1))
+            >>> deepcopy(bid).tag is bid.tag
+            True
+
+        Args:
+            memo:  memo dictionary of ``copy.deepcopy``
+
+        Returns:
+            deep copy of the order
+        """
+        order = self.__copy__()
+        if memo is not None:
+            memo[id(self)] = order
+        tag = self.tag
+        if tag.__class__ not in _ATOMIC_TAG_TYPES:
+            order.tag = deepcopy(tag, memo)
+        return order
 
     @abstractmethod
-    def __repr__(self) -> str:
+    def __str__(self) -> str:
         pass
 
     @property
@@ -167,46 +244,20 @@ class Order(metaclass=ABCMeta):
         return self.order_id == other.order_id
 
 
+@_repr_as_str
 class MarketOrder(Order):
     __slots__ = ()
 
-    if silent_mode:
-        def __str__(self) -> str:
+    def __str__(self) -> str:
+        if self.silent_mode:
             return ''
-    else:
-        def __str__(self) -> str:
-            return (
-                f"(Agent {self.agent_id} @ {Kernel.fmtTime(self.time_placed)}) : "
-                f"MKT Order {'BUY' if self.is_buy_order else 'SELL'} {self.quantity} {self.symbol}"
-            )
-
-    __repr__ = __str__
-
-    def __copy__(self) -> 'MarketOrder':
-        order = self.__class__(
-            self.agent_id,
-            self.time_placed,
-            self.symbol,
-            self.quantity,
-            self.order_id,
-            self.tag
-        )
-        order.fill_price = self.fill_price
-        return order
-
-    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> 'MarketOrder':
-        order = self.__class__(
-            self.agent_id,
-            self.time_placed,
-            self.symbol,
-            self.quantity,
-            self.order_id,
-            deepcopy(self.tag, memo)
+        return (
+            f"(Agent {self.agent_id} @ {Kernel.fmtTime(self.time_placed)}) : "
+            f"MKT Order {'BUY' if self.is_buy_order else 'SELL'} {self.quantity} {self.symbol}"
         )
-        order.fill_price = self.fill_price
-        return order
 
 
+@_repr_as_str
 class LimitOrder(Order):
     """
     LimitOrder class, inherits from Order class, adds a limit price.
@@ -214,6 +265,9 @@ class LimitOrder(Order):
     """
     __slots__ = ("limit_price",)
 
+    # Side of the order book: +1 for buy orders, -1 for sell orders
+    side_sign: int
+
     def __init__(self,
                  agent_id: int,
                  time_placed: pd.Timestamp,
@@ -230,66 +284,34 @@ class LimitOrder(Order):
         # the maximum price the agent will pay (for a buy order).
         self.limit_price = limit_price
 
-    if silent_mode:
-        def __str__(self) -> str:
+    def __str__(self) -> str:
+        if self.silent_mode:
             return ''
-    else:
-        def __str__(self) -> str:
-            tag = self.tag
-            tag_info = f" [{tag}]" if tag is not None else ""
-
-            # Until we make explicit market orders, we make a few assumptions that EXTREME prices on limit
-            # orders are trying to represent a market order. This only affects printing - they still hit
-            # the order book like limit orders, which is wrong.
-            limit_price = self.limit_price
-            limit_info = dollarize(limit_price) if limit_price < sys.maxsize else 'MKT'
-
-            fill_price = self.fill_price
-            filled = f" (filled @ {dollarize(fill_price)})" if fill_price else ""
-            return (
-                f"(Agent {self.agent_id} @ {Kernel.fmtTime(self.time_placed)}{tag_info}) : "
-                f"{'BUY' if self.is_buy_order else 'SELL'} {self.quantity} {self.symbol} @ {limit_info}{filled}"
-            )
 
-    __repr__ = __str__
-
-    def __copy__(self) -> 'LimitOrder':
-        order = self.__class__(
-            self.agent_id,
-            self.time_placed,
-            self.symbol,
-            quantity=self.quantity,
-            limit_price=self.limit_price,
-            order_id=self.order_id,
-            tag=self.tag
-        )
-        order.fill_price = self.fill_price
-        return order
+        tag = self.tag
+        tag_info = f" [{tag}]" if tag is not None else ""
 
-    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> 'LimitOrder':
-        order = self.__class__(
-            self.agent_id,
-            self.time_placed,
-            self.symbol,
-            quantity=self.quantity,
-            limit_price=self.limit_price,
-            order_id=self.order_id,
-            tag=deepcopy(self.tag, memo)
+        # Until we make explicit market orders, we make a few assumptions that EXTREME prices on limit
+        # orders are trying to represent a market order. This only affects printing - they still hit
+        # the order book like limit orders, which is wrong.
+        limit_price = self.limit_price
+        limit_info = dollarize(limit_price) if limit_price < sys.maxsize else 'MKT'
+
+        fill_price = self.fill_price
+        filled = f" (filled @ {dollarize(fill_price)})" if fill_price else ""
+        return (
+            f"(Agent {self.agent_id} @ {Kernel.fmtTime(self.time_placed)}{tag_info}) : "
+            f"{'BUY' if self.is_buy_order else 'SELL'} {self.quantity} {self.symbol} @ {limit_info}{filled}"
         )
-        order.fill_price = self.fill_price
-        return order
 
     def isMatch(self, other: 'LimitOrder') -> bool:
         """Returns True if order 'other' can be matched against input 'self'"""
 
-        is_buy_order = self.is_buy_order
-        if is_buy_order is other.is_buy_order:
+        side_sign = self.side_sign
+        if side_sign == other.side_sign:
             print(f"WARNING: isMatch() called on limit orders of same type: {self} vs {other}")
             return False
-
-        if is_buy_order:
-            return self.limit_price >= other.limit_price
-        return self.limit_price <= other.limit_price
+        return (self.limit_price - other.limit_price) * side_sign >= 0
 
     def hasEqPrice(self, other: 'LimitOrder') -> bool:
         return self.limit_price == other.limit_price
@@ -328,19 +350,17 @@ class LimitOrder(Order):
             result of price comparison
         """
 
-        self_is_buy = self.is_buy_order
-        if self_is_buy is not other.is_buy_order:
+        side_sign = self.side_sign
+        if side_sign != other.side_sign:
             print(
                 f"WARNING: hasBetterPrice() called on orders of different type: "
                 f"{self.__class__.__name__} vs {other.__class__.__name__}"
             )
             return False
-
-        if self_is_buy:
-            return self.limit_price > other.limit_price
-        return self.limit_price < other.limit_price
+        return (self.limit_price - other.limit_price) * side_sign > 0
 
 
+@_repr_as_str
 class BasketOrder(Order):
     """
     BasketOrder class, inherits from Order class.  These are the
@@ -360,37 +380,19 @@ class BasketOrder(Order):
         super().__init__(agent_id, time_placed, symbol, quantity, order_id)
         self.dollar = dollar
 
-    if silent_mode:
-        def __str__(self) -> str:
-            return ""
-    else:
-        def __str__(self) -> str:
-            fill_price = self.fill_price
-            if fill_price:
-                filled = f" (filled @ {dollarize(fill_price) if self.dollar else fill_price})"
-            else:
-                filled = ""
-            # Until we make explicit market orders, we make a few assumptions that EXTREME prices on limit
-            # orders are trying to represent a market order.  This only affects printing - they still hit
-            # the order book like limit orders, which is wrong.
-            return (
-                f"(Order_ID: {self.order_id} Agent {self.agent_id} @ {Kernel.fmtTime(self.time_placed)}) : "
-                f"{'CREATE' if self.is_buy_order else 'REDEEM'} {self.quantity} {self.symbol} @ {filled}{fill_price}"
-            )
-
-    __repr__ = __str__
+    def __str__(self) -> str:
+        if self.silent_mode:
+            return ''
 
-    def __copy__(self) -> 'BasketOrder':
-        order = self.__class__(
-            self.agent_id,
-            self.time_placed,
-            self.symbol,
-            self.quantity,
-            self.dollar,
-            self.order_id
+        fill_price = self.fill_price
+        if fill_price:
+            filled = f" (filled @ {dollarize(fill_price) if self.dollar else fill_price})"
+        else:
+            filled = ""
+        # Until we make explicit market orders, we make a few assumptions that EXTREME prices on limit
+        # orders are trying to represent a market order.  This only affects printing - they still hit
+        # the order book like limit orders, which is wrong.
+        return (
+            f"(Order_ID: {self.order_id} Agent {self.agent_id} @ {Kernel.fmtTime(self.time_placed)}) : "
+            f"{'CREATE' if self.is_buy_order else 'REDEEM'} {self.quantity} {self.symbol} @ {filled}{fill_price}"
         )
-        order.fill_price = self.fill_price
-        return order
-
-    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> 'BasketOrder':
-        return self.__copy__()
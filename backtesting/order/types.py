@@ -21,8 +21,10 @@ class SellMarket(MarketOrder):
 class Bid(LimitOrder):
     __slots__ = ()
     is_buy_order = True
+    side_sign = 1
 
 
 class Ask(LimitOrder):
     __slots__ = ()
     is_buy_order = False
+    side_sign = -1
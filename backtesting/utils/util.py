@@ -1,6 +1,6 @@
 import warnings
 from contextlib import contextmanager
-from functools import partial
+from functools import partial, lru_cache
 from traceback import format_stack
 from typing import Type, Generator, Union, Iterable, List, Any, overload
 
@@ -201,6 +201,12 @@ def get_defined_slots(cls: Type) -> Generator[str, None, None]:
                     yield slot
 
 
+@lru_cache(maxsize=4096)
+def _dollarize_int(cents: int) -> str:
+    # Limit and fill prices repeat heavily across orders, so their string forms are cached
+    return f"${cents / 100:0.2}"
+
+
 @overload
 def dollarize(cents: Iterable[int]) -> List[str]:
     pass
@@ -215,17 +221,22 @@ def dollarize(cents: Union[Iterable[int], int]) -> Union[List[str], str]:
     """
     Dollarize int-cents prices for printing. Defined outside the class for
     utility access by non-agent classes.
-    TODO
+
+    >>> dollarize(250)
+    '$2.5'
+    >>> dollarize([100, 250, 250])
+    ['$1.0', '$2.5', '$2.5']
+
     Args:
-        cents:
+        cents:  price or iterable of prices in cents
 
     Returns:
-
+        dollarized price or list of dollarized prices
     """
-    if hasattr(dollarize, '__iter__'):
+    if isinstance(cents, int):
+        return _dollarize_int(cents)
+    elif hasattr(cents, '__iter__') and not isinstance(cents, str):
         return list(map(dollarize, cents))  # type: ignore
-    elif isinstance(cents, int):
-        return f"${cents / 100:0.2}"
     else:
         # If cents is already a float, there is an error somewhere.
         error_msg = f"ERROR: dollarize(cents) called without int or iterable of ints: {cents}"
@@ -0,0 +1,11 @@
+import sys
+
+from backtesting.oracle.types import convert_fundamental_to_memmap
+
+if len(sys.argv) < 2:
+    print("Usage: python cli/fundamental_to_memmap.py <Fundamental file> [Fundamental file ...]")
+    sys.exit()
+
+for fundamental_file in sys.argv[1:]:
+    times_file, values_file = convert_fundamental_to_memmap(fundamental_file)
+    print(f"Converted {fundamental_file} into {times_file} and {values_file}")
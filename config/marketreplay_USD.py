@@ -12,7 +12,7 @@ from backtesting.agent import OrderBookImbalanceAgent
 from backtesting.agent.examples.MarketReplayAgentUSD import MarketReplayAgentUSD
 from backtesting.agent.examples.MomentumAgent import MomentumAgent
 from backtesting.core import Kernel
-from backtesting.order.base import LimitOrder
+from backtesting.order.base import Order
 from backtesting.utils import util
 from model.LatencyModel import LatencyModel
 
@@ -113,7 +113,7 @@ seed = args.seed or int(pd.Timestamp.now().timestamp() * 1_000_000) % (2 ** 32 -
 np.random.seed(seed)
 
 backtesting.globals.silent_mode = not args.verbose
-LimitOrder.silent_mode = not args.verbose
+Order.silent_mode = not args.verbose
 
 exchange_log_orders = False  # True
 log_orders = None
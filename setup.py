@@ -15,9 +15,11 @@ setup(
         'jsons',
         'kiwisolver',
         'matplotlib',
+        'numba',
         'numpy',
         'pandas',
         'pprofile',
+        'pyarrow',
         'pyparsing',
         'python-dateutil',
         'pytz',